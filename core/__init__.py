@@ -20,14 +20,23 @@ __all__ = [
     'reconstruct_secret',
 ]
 
-from .field_math import modinv, lagrange_coeffs_at_zero, next_prime, is_prime
+from .field_math import (
+    modinv,
+    batch_modinv,
+    lagrange_coeffs_at_zero,
+    barycentric_coeffs_at_zero,
+    next_prime,
+    is_prime,
+)
 from .image_utils import load_image, save_image, detect_image_properties
 from .share_io import save_share, load_share, validate_shares_compatible
 from .shamir import split_image_into_shares, reconstruct_from_shares
 
 __all__ = [
     'modinv',
+    'batch_modinv',
     'lagrange_coeffs_at_zero',
+    'barycentric_coeffs_at_zero',
     'next_prime',
     'is_prime',
     'load_image',
@@ -0,0 +1,57 @@
+"""
+ctypes bindings for the optional C share-evaluation kernel (shamir_kernel.c).
+
+The shared library is not built automatically; see the header of
+core/shamir_kernel.c for the build command. If it is missing,
+KERNEL_AVAILABLE is False and the callers use the Numba / NumPy paths.
+"""
+
+import ctypes
+import os
+
+import numpy as np
+
+_LIB_NAMES = ('libshamir_kernel.so', 'libshamir_kernel.dylib', 'shamir_kernel.dll')
+
+
+def _load_library():
+    """Load the compiled kernel from the core/ directory, or return None."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in _LIB_NAMES:
+        path = os.path.join(here, name)
+        if os.path.exists(path):
+            try:
+                return ctypes.CDLL(path)
+            except OSError:
+                return None
+    return None
+
+
+_lib = _load_library()
+KERNEL_AVAILABLE = _lib is not None
+
+if KERNEL_AVAILABLE:
+    _u32_array = np.ctypeslib.ndpointer(dtype=np.uint32, flags='C_CONTIGUOUS')
+    _lib.horner_u32.restype = None
+    _lib.horner_u32.argtypes = [
+        _u32_array,
+        ctypes.c_size_t,
+        ctypes.c_size_t,
+        ctypes.c_uint32,
+        ctypes.c_uint32,
+        _u32_array,
+    ]
+
+
+def horner_u32(coeffs, x, prime, out):
+    """
+    Evaluate the per-pixel polynomials at x with the C kernel.
+
+    Args:
+        coeffs: C-contiguous uint32 array of shape (k, N), coeffs[0] is the secret
+        x: Share x-coordinate
+        prime: Prime modulus (< 2^32)
+        out: C-contiguous uint32 array of shape (N,), written in place
+    """
+    k, N = coeffs.shape
+    _lib.horner_u32(coeffs, k, N, x, prime, out)
@@ -0,0 +1,155 @@
+"""
+Optional Numba-compiled kernels for the per-pixel hot loops.
+
+The kernels walk the image pixel by pixel, keeping the running polynomial /
+Lagrange sum in a register instead of allocating an H x W temporary for every
+NumPy `*` and `%`. Pixels are distributed over threads with `prange`.
+
+If Numba is not installed, NUMBA_AVAILABLE is False and the callers fall back
+to the pure NumPy implementation.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(inline='always')
+    def _reduce(v, prime, m):
+        """
+        v mod prime for v >= 0.
+        
+        For Fermat primes prime = 2^m + 1 (3, 5, 17, 257, 65537) this uses
+        only shifts, masks and adds: 2^(2m) = 1 and 2^m = -1 (mod prime).
+        m = 0 selects the ordinary (integer division) modulo.
+        """
+        if m == 0:
+            return v % prime
+        mask = (np.int64(1) << m) - 1
+        while v >> (2 * m):
+            v = (v & ((np.int64(1) << (2 * m)) - 1)) + (v >> (2 * m))
+        t = (v & mask) - (v >> m)
+        if t < 0:
+            t += prime
+        return t
+
+    @njit(parallel=True, cache=True)
+    def eval_shares(coeffs, powers, prime, m, defer, out):
+        """
+        Evaluate the per-pixel polynomials at every x.
+        
+        Uses the precomputed table powers[xi, j] = x^j mod prime, so each
+        share is a dot product of independent multiplies (no Horner chain).
+        Each pixel's k coefficients are loaded once for all n shares.
+        
+        Args:
+            coeffs: Coefficient array of shape (k, N), coeffs[0] is the secret
+            powers: int64 array of shape (n, k) from _power_table()
+            prime: Prime modulus
+            m: Exponent if prime == 2^m + 1, else 0
+            defer: True if k*(prime-1)^2 fits in int64, so the sum is reduced
+                   only once at the end
+            out: Output array of shape (n, N), written in place
+        """
+        k, N = coeffs.shape
+        n = powers.shape[0]
+        for pix in prange(N):
+            for xi in range(n):
+                y = np.int64(0)
+                for j in range(k):
+                    y += np.int64(coeffs[j, pix]) * powers[xi, j]
+                    if not defer:
+                        y = _reduce(y, prime, m)
+                out[xi, pix] = _reduce(y, prime, m)
+
+    @njit(parallel=True, cache=True)
+    def lagrange_combine(shares, coeffs, prime, m, defer, out):
+        """
+        Combine k shares into the secret: out = sum_i coeffs[i] * shares[i] mod prime.
+        
+        Args:
+            shares: Stacked share array of shape (k, N)
+            coeffs: int64 array of k Lagrange coefficients at x=0
+            prime: Prime modulus
+            m: Exponent if prime == 2^m + 1, else 0
+            defer: True if k*(prime-1)^2 fits in int64, so the sum is reduced
+                   only once at the end
+            out: Output array of shape (N,), written in place
+        """
+        k, N = shares.shape
+        for pix in prange(N):
+            acc = np.int64(0)
+            for i in range(k):
+                y = np.int64(shares[i, pix])
+                if y >= prime:
+                    # Only shares edited outside the field need reducing
+                    y = _reduce(y, prime, m)
+                acc += y * coeffs[i]
+                if not defer:
+                    acc = _reduce(acc, prime, m)
+            out[pix] = _reduce(acc, prime, m)
+
+    # Unrolled kernels for the common thresholds k = 2 and k = 3: with the
+    # coefficient count fixed at compile time every pixel is a single fused
+    # expression (about twice as fast as the generic loops). Callers use them
+    # only when k*(prime-1)^2 fits in int64.
+
+    @njit(parallel=True, cache=True)
+    def eval_shares_k2(coeffs, powers, prime, m, out):
+        """eval_shares() for k = 2 with a single final reduction."""
+        n = powers.shape[0]
+        for pix in prange(coeffs.shape[1]):
+            c0 = np.int64(coeffs[0, pix])
+            c1 = np.int64(coeffs[1, pix])
+            for xi in range(n):
+                out[xi, pix] = _reduce(c0 + c1 * powers[xi, 1], prime, m)
+
+    @njit(parallel=True, cache=True)
+    def eval_shares_k3(coeffs, powers, prime, m, out):
+        """eval_shares() for k = 3 with a single final reduction."""
+        n = powers.shape[0]
+        for pix in prange(coeffs.shape[1]):
+            c0 = np.int64(coeffs[0, pix])
+            c1 = np.int64(coeffs[1, pix])
+            c2 = np.int64(coeffs[2, pix])
+            for xi in range(n):
+                out[xi, pix] = _reduce(c0 + c1 * powers[xi, 1] + c2 * powers[xi, 2], prime, m)
+
+    @njit(parallel=True, cache=True)
+    def lagrange_combine_k2(s0, s1, l0, l1, prime, m, out):
+        """lagrange_combine() for two flat share arrays, without stacking them."""
+        for pix in prange(out.size):
+            y0 = np.int64(s0[pix])
+            y1 = np.int64(s1[pix])
+            if y0 >= prime or y1 >= prime:
+                # Only shares edited outside the field need reducing
+                y0 = _reduce(y0, prime, m)
+                y1 = _reduce(y1, prime, m)
+            out[pix] = _reduce(y0 * l0 + y1 * l1, prime, m)
+
+    @njit(parallel=True, cache=True)
+    def lagrange_combine_k3(s0, s1, s2, l0, l1, l2, prime, m, out):
+        """lagrange_combine() for three flat share arrays, without stacking them."""
+        for pix in prange(out.size):
+            y0 = np.int64(s0[pix])
+            y1 = np.int64(s1[pix])
+            y2 = np.int64(s2[pix])
+            if y0 >= prime or y1 >= prime or y2 >= prime:
+                y0 = _reduce(y0, prime, m)
+                y1 = _reduce(y1, prime, m)
+                y2 = _reduce(y2, prime, m)
+            out[pix] = _reduce(y0 * l0 + y1 * l1 + y2 * l2, prime, m)
+
+else:
+    eval_shares = None
+    lagrange_combine = None
+    eval_shares_k2 = None
+    eval_shares_k3 = None
+    lagrange_combine_k2 = None
+    lagrange_combine_k3 = None
@@ -2,11 +2,30 @@
 Finite field arithmetic operations for Shamir's Secret Sharing.
 """
 
+import sys
+from functools import lru_cache
+
+# pow(a, -1, p) computes modular inverses natively since Python 3.8
+_HAS_POW_INVERSE = sys.version_info >= (3, 8)
+
+# Small primes used for trial division before Miller-Rabin
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53)
+
+# Witnesses that make Miller-Rabin deterministic for n < 3.3e24
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Largest prime field whose full inverse table is precomputed (covers the
+# 257 field of 8-bit images)
+_INV_TABLE_MAX = 4096
+
 
 def is_prime(n):
     """
     Check if n is a prime number.
     
+    Screens against small primes, then runs deterministic Miller-Rabin
+    (exact for n < 3.3e24, which covers every prime usable as a field here).
+    
     Args:
         n: Integer to check for primality
         
@@ -15,33 +34,58 @@ def is_prime(n):
     """
     if n < 2:
         return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
+    for sp in _SMALL_PRIMES:
+        if n % sp == 0:
+            return n == sp
+    
+    # Write n - 1 = d * 2^s with d odd
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
     
-    # Check odd divisors up to sqrt(n)
-    i = 3
-    while i * i <= n:
-        if n % i == 0:
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
             return False
-        i += 2
     return True
 
 
+@lru_cache(maxsize=1024)
 def next_prime(n):
     """
     Find the smallest prime number greater than n.
     
+    Candidates are walked on a 6k +/- 1 wheel (steps of +2/+4), since every
+    prime above 3 has that form.
+    
     Args:
         n: Starting integer
         
     Returns:
         The next prime number after n
     """
+    if n < 2:
+        return 2
+    if n < 3:
+        return 3
+    
+    # First 6k +/- 1 candidate greater than n
     candidate = n + 1
-    while not is_prime(candidate):
+    while candidate % 6 not in (1, 5):
         candidate += 1
+    step = 2 if candidate % 6 == 5 else 4
+    
+    while not is_prime(candidate):
+        candidate += step
+        step = 6 - step
     return candidate
 
 
@@ -49,10 +93,29 @@ def next_prime(n):
 find_next_prime = next_prime
 
 
+@lru_cache(maxsize=8)
+def _inverse_table(p):
+    """
+    Table of a^-1 mod p for a = 0..p-1 (entry 0 unused), or None if p is
+    too large or not prime.
+    
+    Built in O(p) with inv(a) = -(p // a) * inv(p mod a) mod p.
+    """
+    if p > _INV_TABLE_MAX or not is_prime(p):
+        return None
+    
+    inv = [0, 1] + [0] * (p - 2)
+    for a in range(2, p):
+        inv[a] = (p - p // a) * inv[p % a] % p
+    return inv
+
+
 def modinv(a, p):
     """
     Compute modular multiplicative inverse of a modulo p.
-    Uses Extended Euclidean Algorithm.
+    Small prime fields use a cached lookup table; otherwise Python's built-in
+    pow(a, -1, p) (Extended Euclid in C) when available, and the pure Python
+    Extended Euclidean Algorithm as a last resort.
     
     Args:
         a: Number to find inverse of
@@ -68,6 +131,17 @@ def modinv(a, p):
     if a == 0:
         raise ZeroDivisionError("Inverse of 0 does not exist")
     
+    # Small prime fields: one lookup in the cached inverse table
+    table = _inverse_table(p)
+    if table is not None:
+        return table[a]
+    
+    if _HAS_POW_INVERSE:
+        try:
+            return pow(a, -1, p)
+        except ValueError:
+            raise ZeroDivisionError(f"Inverse of {a} modulo {p} does not exist")
+    
     # Extended Euclidean Algorithm
     lm, hm = 1, 0
     low, high = a % p, p
@@ -80,6 +154,44 @@ def modinv(a, p):
     return lm % p
 
 
+def batch_modinv(values, p):
+    """
+    Invert several numbers modulo p with a single modinv call.
+    
+    Uses Montgomery's trick: invert the product of all values once, then
+    walk the prefix products backwards to peel off each individual inverse.
+    
+    Args:
+        values: List of integers to invert (all nonzero mod p)
+        p: Prime modulus
+        
+    Returns:
+        List of modular inverses, in the same order as values
+        
+    Raises:
+        ZeroDivisionError: If any value is 0 mod p
+    """
+    values = [int(v) % p for v in values]
+    if not values:
+        return []
+    
+    # prefix[i] = values[0] * ... * values[i] mod p
+    prefix = []
+    acc = 1
+    for v in values:
+        acc = (acc * v) % p
+        prefix.append(acc)
+    
+    inv_all = modinv(prefix[-1], p)
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        inverses[i] = (inv_all * prefix[i - 1]) % p
+        inv_all = (inv_all * values[i]) % p
+    inverses[0] = inv_all
+    
+    return inverses
+
+
 def lagrange_coeffs_at_zero(xs, p):
     """
     Compute Lagrange interpolation coefficients at x=0.
@@ -98,7 +210,8 @@ def lagrange_coeffs_at_zero(xs, p):
     """
     k = len(xs)
     xs = [int(x) % p for x in xs]
-    coeffs = []
+    nums = []
+    dens = []
     
     for i in range(k):
         xi = xs[i]
@@ -113,7 +226,50 @@ def lagrange_coeffs_at_zero(xs, p):
             num = (num * (-xj)) % p
             den = (den * (xi - xj)) % p
         
-        inv_den = modinv(den, p)
-        coeffs.append((num * inv_den) % p)
+        nums.append(num)
+        dens.append(den)
+    
+    # Invert all denominators together (one modinv instead of k)
+    inv_dens = batch_modinv(dens, p)
+    return [(num * inv_den) % p for num, inv_den in zip(nums, inv_dens)]
+
+
+def barycentric_coeffs_at_zero(xs, p):
+    """
+    Compute Lagrange interpolation coefficients at x=0 using the
+    barycentric (second) form.
+    
+    With weights w_i = 1 / prod_{j != i} (x_i - x_j), the coefficients are
+      L_i = (w_i / (0 - x_i)) / sum_j (w_j / (0 - x_j))
+    which avoids the per-i numerator products of lagrange_coeffs_at_zero.
+    The weight denominators and the (0 - x_i) terms are inverted together
+    in one batch, so only two modinv calls are made regardless of k.
+    
+    Args:
+        xs: List of x-coordinates (distinct, nonzero)
+        p: Prime modulus for the finite field
+        
+    Returns:
+        List of Lagrange coefficients (one per x in xs), identical to
+        lagrange_coeffs_at_zero(xs, p)
+    """
+    k = len(xs)
+    xs = [int(x) % p for x in xs]
     
-    return coeffs
+    dens = []
+    for i in range(k):
+        xi = xs[i]
+        den = 1
+        for j in range(k):
+            if j != i:
+                den = (den * (xi - xs[j])) % p
+        dens.append(den)
+    
+    # One batch inversion covers both the weights and 1 / (0 - x_i)
+    inverses = batch_modinv(dens + [-x for x in xs], p)
+    weights, inv_neg_xs = inverses[:k], inverses[k:]
+    
+    terms = [(w * t) % p for w, t in zip(weights, inv_neg_xs)]
+    inv_total = modinv(sum(terms) % p, p)
+    return [(t * inv_total) % p for t in terms]
+
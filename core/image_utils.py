@@ -6,6 +6,13 @@ import numpy as np
 from PIL import Image
 from .field_math import next_prime
 
+# Prime just above the full range of each detected bit depth, so the common
+# image cases need no prime search (e.g. 8-bit -> next_prime(255) = 257)
+_PRIME_HINTS = {1: 2, 2: 5, 4: 17, 8: 257, 16: 65537}
+
+# PNGs with at least this many pixels are written with fast zlib settings
+_FAST_PNG_PIXELS = 1 << 20
+
 
 def detect_image_properties(img_array):
     """
@@ -41,8 +48,9 @@ def detect_image_properties(img_array):
     else:
         bit_depth = 32  # Higher precision
     
-    # Calculate recommended prime (next prime after max_value)
-    recommended_prime = next_prime(max_val)
+    # Calculate recommended prime: the known prime for the bit depth's full
+    # range, falling back to the next prime after max_value
+    recommended_prime = _PRIME_HINTS.get(bit_depth) or next_prime(max_val)
     
     return {
         'mode': mode,
@@ -85,8 +93,12 @@ def load_image(filepath, grayscale=None):
         # Convert any other mode to RGB
         img = img.convert('RGB')
     
-    # Convert to numpy array with appropriate dtype
-    arr = np.array(img)
+    # Wrap PIL's raw 8-bit buffer directly (one memcpy in tobytes, no
+    # per-image array-interface conversion); the result is read-only and
+    # only read by the callers
+    width, height = img.size
+    shape = (height, width) if img.mode == 'L' else (height, width, 3)
+    arr = np.frombuffer(img.tobytes(), dtype=np.uint8).reshape(shape)
     
     return arr
 
@@ -108,18 +120,26 @@ def save_image(img_array, filepath, mode='auto'):
     if mode == 'auto':
         mode = 'grayscale' if img_array.ndim == 2 else 'rgb'
     
-    if mode == 'grayscale':
-        if img_array.ndim == 3:
-            # Convert RGB to grayscale if needed
-            img_array = np.mean(img_array, axis=2).astype(np.uint8)
-        img = Image.fromarray(img_array, mode='L')
-    else:  # RGB
-        if img_array.ndim == 2:
-            # Convert grayscale to RGB
-            img_array = np.stack([img_array] * 3, axis=-1)
-        img = Image.fromarray(img_array, mode='RGB')
+    if mode == 'grayscale' and img_array.ndim == 3:
+        # Convert RGB to grayscale if needed
+        img_array = np.mean(img_array, axis=2).astype(np.uint8)
+    
+    # Wrap the (C-contiguous) buffer directly instead of copying it into PIL
+    img_array = np.ascontiguousarray(img_array)
+    height, width = img_array.shape[:2]
+    pil_mode = 'L' if img_array.ndim == 2 else 'RGB'
+    img = Image.frombuffer(pil_mode, (width, height), img_array, 'raw', pil_mode, 0, 1)
     
-    img.save(filepath)
+    if mode != 'grayscale' and pil_mode == 'L':
+        # Convert grayscale to RGB inside PIL rather than tripling it in NumPy
+        img = img.convert('RGB')
+    
+    if str(filepath).lower().endswith('.png') and width * height >= _FAST_PNG_PIXELS:
+        # zlib dominates the save time of large PNGs; level 1 is much faster
+        # for a modestly larger file
+        img.save(filepath, compress_level=1)
+    else:
+        img.save(filepath)
 
 
 def normalize_to_uint8(img_array, original_max_value):
@@ -2,11 +2,273 @@
 Core Shamir's Secret Sharing implementation for images.
 """
 
+import os
+
 import numpy as np
-from .field_math import lagrange_coeffs_at_zero
+from .field_math import lagrange_coeffs_at_zero, barycentric_coeffs_at_zero
+from ._shamir_numba import (
+    NUMBA_AVAILABLE,
+    eval_shares,
+    lagrange_combine,
+    eval_shares_k2,
+    eval_shares_k3,
+    lagrange_combine_k2,
+    lagrange_combine_k3,
+)
+from ._shamir_kernel import KERNEL_AVAILABLE, horner_u32
+from ._shamir_cupy import CUPY_AVAILABLE, evaluate_block_gpu, lagrange_combine_gpu
+
+# Target size of the coefficient slice processed per tile (fits in L2 cache)
+_TILE_BYTES = 256 * 1024
+
+# Coefficient bytes per GPU transfer (large blocks amortize the launches)
+_GPU_TILE_BYTES = 64 * 1024 * 1024
+
+_DEVICES = ('cpu', 'gpu')
+
+
+def _rows_per_tile(k, row_elems, itemsize, tile_bytes=_TILE_BYTES):
+    """Number of image rows whose k coefficient rows fit in tile_bytes."""
+    return max(1, tile_bytes // (k * row_elems * itemsize))
+
+
+def _dot_fits_int64(k, prime):
+    """True if a k-term sum of products of field elements cannot overflow int64."""
+    return k * (prime - 1) ** 2 < 2 ** 63
+
+
+def _step_fits_int64(prime):
+    """True if a reduced value plus one product of field elements fits in int64."""
+    return prime * (prime - 1) < 2 ** 63
+
+
+def _check_device(device):
+    """Validate the device name and that the GPU backend can be used."""
+    if device not in _DEVICES:
+        raise ValueError(f"Unknown device '{device}', expected one of {_DEVICES}")
+    if device == 'gpu' and not CUPY_AVAILABLE:
+        raise RuntimeError("The GPU device requires CuPy (pip install cupy-cuda12x)")
+
+
+def _max_share_value(share_arrays):
+    """Largest value stored in any of the share arrays."""
+    return max(int(np.max(y_arr)) for y_arr in share_arrays)
+
+
+def _fermat_exponent(prime):
+    """Return m if prime == 2^m + 1 (a Fermat prime such as 257), else 0."""
+    m = (prime - 1).bit_length() - 1
+    return m if m > 0 and prime == (1 << m) + 1 else 0
+
+
+def _field_dtype(prime):
+    """Smallest unsigned dtype that holds every field element (0..prime-1)."""
+    for dtype in (np.uint8, np.uint16):
+        if prime - 1 <= np.iinfo(dtype).max:
+            return dtype
+    return np.uint32
+
+
+def _dot_fits_float64(k, prime):
+    """True if a k-term sum of products of field elements is exact in float64."""
+    return k * (prime - 1) ** 2 < 2 ** 53
 
 
-def split_image_into_shares(img_array, n, k, prime, rng=None):
+def _power_table(n, k, prime):
+    """
+    Build the (n, k) Vandermonde table powers[x-1, j] = x^j mod prime.
+    
+    Computed once per split and shared by the evaluation backends.
+    """
+    xs = np.arange(1, n + 1, dtype=np.int64)
+    powers = np.ones((n, k), dtype=np.int64)
+    for j in range(1, k):
+        powers[:, j] = (powers[:, j - 1] * xs) % prime
+    return powers
+
+
+def _random_field_elements(rng, prime, size, dtype):
+    """
+    Draw uniform field elements in [0, prime).
+    
+    With no rng, the smallest of uint16/uint32/uint64 words that covers the
+    field is read from the OS CSPRNG (os.urandom). Words at or above the
+    largest multiple of prime are redrawn, so reducing the rest modulo prime
+    is unbiased; for prime 257 only 1 in 65536 words is rejected. Passing a NumPy Generator
+    gives reproducible (but not cryptographically secure) coefficients
+    instead.
+    """
+    if rng is not None:
+        return rng.integers(0, prime, size=size, dtype=dtype)
+    
+    if prime <= 1 << 16:
+        word = np.uint16
+    elif prime <= 1 << 32:
+        word = np.uint32
+    else:
+        # A uint32 word could never reach a field this large (cutoff would be 0)
+        word = np.uint64
+    itemsize = np.dtype(word).itemsize
+    limit = 1 << (8 * itemsize)
+    cutoff = limit - limit % prime
+    
+    count = int(np.prod(size))
+    words = np.frombuffer(bytearray(os.urandom(itemsize * count)), dtype=word)
+    rejected = np.flatnonzero(words >= cutoff)
+    while rejected.size:
+        redraw = np.frombuffer(os.urandom(itemsize * rejected.size), dtype=word)
+        words[rejected] = redraw
+        rejected = rejected[redraw >= cutoff]
+    
+    np.remainder(words, prime, out=words)
+    return words.astype(dtype, copy=False).reshape(size)
+
+
+def _block_scratch(powers, block, prime):
+    """
+    Allocate the work arrays _evaluate_block reuses for every block.
+    
+    Args:
+        powers: (n, k) table of x^j mod prime from _power_table()
+        block: Largest number of pixels per block
+        prime: Prime number for finite field operations
+        
+    Returns:
+        Dictionary of flat scratch arrays holding up to `block` pixels
+    """
+    n, k = powers.shape
+    if _dot_fits_float64(k, prime):
+        return {
+            'V': powers.astype(np.float64),
+            'coeffs_f': np.empty(k * block, dtype=np.float64),
+            'y_f': np.empty(n * block, dtype=np.float64),
+            'y_i': np.empty(n * block, dtype=np.int64),
+        }
+    
+    # Only primes too large for the float64 GEMM (about 2^26 and up) reach
+    # Horner, whose intermediates y*x + c need a uint64 accumulator
+    return {'acc': np.empty(block, dtype=np.uint64)}
+
+
+def _evaluate_block(coeffs, prime, out, scratch):
+    """
+    Evaluate one block of per-pixel polynomials at x = 1..n with NumPy.
+    
+    Args:
+        coeffs: Coefficient block of shape (k, B), coeffs[0] is the secret
+        prime: Prime number for finite field operations
+        out: uint32 array of shape (n, B), written in place
+        scratch: Work arrays from _block_scratch()
+    """
+    k, B = coeffs.shape
+    n = out.shape[0]
+    
+    if 'V' in scratch:
+        # With the Vandermonde table V, all n shares of the block come from
+        # one matrix product Y = V @ coeffs (a BLAS GEMM in float64, exact
+        # because every partial sum is below k*(prime-1)^2 < 2^53), reduced
+        # modulo once. Every step writes into the preallocated scratch.
+        coeffs_f = scratch['coeffs_f'][:k * B].reshape(k, B)
+        y_f = scratch['y_f'][:n * B].reshape(n, B)
+        y_i = scratch['y_i'][:n * B].reshape(n, B)
+        np.copyto(coeffs_f, coeffs)
+        np.matmul(scratch['V'], coeffs_f, out=y_f)
+        np.copyto(y_i, y_f, casting='unsafe')
+        np.mod(y_i, prime, out=y_i)
+        out[...] = y_i
+        return
+    
+    # One accumulator reused for every x and block
+    acc = scratch['acc'][:B]
+    limit = np.iinfo(acc.dtype).max
+    for x in range(1, n + 1):
+        # Horner's method: y = (...(c[k-1]*x + c[k-2])*x + ... + c[0]) mod prime
+        # Updated in place so a single accumulator array is reused. `bound`
+        # tracks the largest value acc can hold, so the modulo is applied only
+        # when the next step could overflow, plus once at the end.
+        np.copyto(acc, coeffs[k - 1])
+        bound = prime - 1
+        for j in range(k - 2, -1, -1):
+            if bound * x + prime - 1 > limit:
+                np.mod(acc, prime, out=acc)
+                bound = prime - 1
+            np.multiply(acc, x, out=acc)
+            np.add(acc, coeffs[j], out=acc)
+            bound = bound * x + prime - 1
+        np.mod(acc, prime, out=acc)
+        
+        out[x - 1] = acc
+
+
+def _compute_shares(img_array, n, k, prime, rng, device):
+    """
+    Compute all n shares of a validated image into one (n, N) uint32 array.
+    
+    The random coefficients are generated block by block (bands of full
+    image rows sized by _TILE_BYTES) into one reused buffer, and each block
+    is evaluated at every x before the next is drawn, so the full (k, H, W)
+    coefficient tensor is never materialized.
+    
+    On the CPU uses the compiled C kernel if it has been built, then Numba,
+    then NumPy; device='gpu' evaluates each (larger) block with CuPy.
+    """
+    shape = img_array.shape
+    secret = img_array.reshape(-1)
+    N = secret.size
+    
+    # Coefficients are < prime, so they are kept in the narrowest unsigned
+    # type that holds the field (uint16 for prime 257) to cut memory traffic;
+    # the C kernel takes uint32
+    gpu = device == 'gpu'
+    use_kernel = KERNEL_AVAILABLE and not gpu
+    # The generic Numba kernel accumulates in int64, so fields whose products
+    # overflow it (prime above about 3e9) go to the C kernel or NumPy instead
+    use_numba = NUMBA_AVAILABLE and not gpu and _step_fits_int64(prime)
+    field_dtype = np.uint32 if use_kernel else _field_dtype(prime)
+    row_elems = N // shape[0] if N else 1
+    tile_bytes = _GPU_TILE_BYTES if gpu else _TILE_BYTES
+    block = _rows_per_tile(k, row_elems, np.dtype(field_dtype).itemsize, tile_bytes) * row_elems
+    coeffs_buf = np.empty(k * min(block, N), dtype=field_dtype)
+    
+    # x^j mod prime table, built once and reused for every block
+    powers = _power_table(n, k, prime)
+    fermat_m = _fermat_exponent(prime)
+    defer = _dot_fits_int64(k, prime)
+    if not (gpu or use_kernel or use_numba):
+        scratch = _block_scratch(powers, min(block, N), prime)
+    
+    all_y = np.empty((n, N), dtype=np.uint32)
+    for p0 in range(0, N, block):
+        p1 = min(p0 + block, N)
+        coeffs = coeffs_buf[:k * (p1 - p0)].reshape(k, p1 - p0)
+        
+        # Polynomial of degree k-1 has k coefficients
+        # coeffs[0] = secret, coeffs[1..k-1] = random (one RNG call per block)
+        coeffs[0] = secret[p0:p1]
+        coeffs[1:] = _random_field_elements(rng, prime, (k - 1, p1 - p0), field_dtype)
+        
+        if gpu:
+            evaluate_block_gpu(coeffs, powers, prime, all_y[:, p0:p1])
+        elif use_kernel:
+            # C kernel, one x at a time (AVX2 for small primes)
+            for x in range(1, n + 1):
+                horner_u32(coeffs, x, prime, all_y[x - 1, p0:p1])
+        elif use_numba:
+            # Compiled kernel evaluating all n shares per pixel in one pass
+            # over the coefficients
+            if defer and k == 2:
+                eval_shares_k2(coeffs, powers, prime, fermat_m, all_y[:, p0:p1])
+            elif defer and k == 3:
+                eval_shares_k3(coeffs, powers, prime, fermat_m, all_y[:, p0:p1])
+            else:
+                eval_shares(coeffs, powers, prime, fermat_m, defer, all_y[:, p0:p1])
+        else:
+            _evaluate_block(coeffs, prime, all_y[:, p0:p1], scratch)
+    
+    return all_y
+
+
+def split_image_into_shares(img_array, n, k, prime, rng=None, device='cpu'):
     """
     Split an image into n shares with threshold k using Shamir's Secret Sharing.
     
@@ -15,13 +277,15 @@ def split_image_into_shares(img_array, n, k, prime, rng=None):
         n: Total number of shares to create
         k: Threshold number of shares needed for reconstruction
         prime: Prime number for finite field operations
-        rng: Random number generator (optional)
+        rng: NumPy Generator for reproducible coefficients (optional);
+             by default they come from the OS CSPRNG
+        device: 'cpu' (default) or 'gpu' to evaluate the shares with CuPy
         
     Returns:
-        Dictionary mapping x (1..n) -> share_array
+        uint32 array of shape (n, H, W) or (n, H, W, 3); row x-1 is the
+        share for x = 1..n
     """
-    if rng is None:
-        rng = np.random.default_rng()
+    _check_device(device)
     
     if not (2 <= k <= n):
         raise ValueError(f"Require 2 <= k <= n, got k={k}, n={n}")
@@ -33,54 +297,21 @@ def split_image_into_shares(img_array, n, k, prime, rng=None):
             f"Image max value ({max_val}) must be less than prime ({prime})"
         )
     
-    # Convert to int64 for calculations
-    secrets = img_array.astype(np.int64)
-    
-    # Determine if grayscale or RGB
-    if img_array.ndim == 2:
-        # Grayscale: H x W
-        H, W = img_array.shape
-        is_grayscale = True
-    elif img_array.ndim == 3:
-        # RGB: H x W x C
-        H, W, C = img_array.shape
+    # Validate grayscale (H x W) or RGB (H x W x 3) layout
+    if img_array.ndim == 3:
+        C = img_array.shape[2]
         if C != 3:
             raise ValueError(f"Expected 3 channels for RGB, got {C}")
-        is_grayscale = False
-    else:
+    elif img_array.ndim != 2:
         raise ValueError(f"Unexpected image dimensions: {img_array.ndim}")
     
-    # Generate random polynomial coefficients
-    # Polynomial of degree k-1 has k coefficients
-    # coeffs[0] = secret, coeffs[1..k-1] = random
-    if is_grayscale:
-        coeffs = np.empty((k, H, W), dtype=np.int64)
-        coeffs[0] = secrets
-        for j in range(1, k):
-            coeffs[j] = rng.integers(0, prime, size=(H, W), dtype=np.int64)
-    else:
-        coeffs = np.empty((k, H, W, C), dtype=np.int64)
-        coeffs[0] = secrets
-        for j in range(1, k):
-            coeffs[j] = rng.integers(0, prime, size=(H, W, C), dtype=np.int64)
-    
-    # Evaluate polynomial at x = 1, 2, ..., n
-    shares = {}
-    for x in range(1, n + 1):
-        # y = sum_{j=0}^{k-1} coeffs[j] * x^j  (mod prime)
-        x_pow = 1
-        y = np.zeros_like(secrets, dtype=np.int64)
-        for j in range(k):
-            y = (y + coeffs[j] * x_pow) % prime
-            x_pow = (x_pow * x) % prime
-        
-        # Store as uint32 to handle values up to large primes
-        shares[x] = y.astype(np.uint32)
-    
-    return shares
+    # Evaluate polynomial at x = 1, 2, ..., n, written straight into one
+    # contiguous (n, ...) output instead of n separate share arrays
+    all_y = _compute_shares(img_array, n, k, prime, rng, device)
+    return all_y.reshape((n,) + img_array.shape)
 
 
-def reconstruct_from_shares(share_arrays, xs, prime):
+def reconstruct_from_shares(share_arrays, xs, prime, device='cpu'):
     """
     Reconstruct an image from k or more shares using Lagrange interpolation.
     
@@ -88,10 +319,13 @@ def reconstruct_from_shares(share_arrays, xs, prime):
         share_arrays: List of share arrays (each H x W or H x W x 3)
         xs: List of x-coordinates corresponding to each share
         prime: Prime number for finite field operations
+        device: 'cpu' (default) or 'gpu' to combine the shares with CuPy
         
     Returns:
         Reconstructed image array (same shape as shares)
     """
+    _check_device(device)
+    
     k = len(xs)
     if k != len(share_arrays):
         raise ValueError(
@@ -101,23 +335,83 @@ def reconstruct_from_shares(share_arrays, xs, prime):
     if k < 2:
         raise ValueError(f"Need at least 2 shares to reconstruct, got {k}")
     
-    # Compute Lagrange coefficients at x=0
-    lagrange_coeffs = lagrange_coeffs_at_zero(xs, prime)
+    # The unrolled kernels index every share by the first one's size
+    shape = np.shape(share_arrays[0])
+    for i, y_arr in enumerate(share_arrays[1:], 1):
+        if np.shape(y_arr) != shape:
+            raise ValueError(
+                f"Share {i} has shape {np.shape(y_arr)}, expected {shape}"
+            )
+    
+    # Compute Lagrange coefficients at x=0 (barycentric form pays off for k >= 5)
+    if k >= 5:
+        lagrange_coeffs = barycentric_coeffs_at_zero(xs, prime)
+    else:
+        lagrange_coeffs = lagrange_coeffs_at_zero(xs, prime)
     
     # Reconstruct: secret = sum_i (y_i * L_i) mod prime
-    accum = None
-    for li, y_arr in zip(lagrange_coeffs, share_arrays):
-        # Convert to int64 to handle large intermediate values
-        y_int = y_arr.astype(np.int64) % prime
-        term = (y_int * int(li)) % prime
+    if device == 'gpu':
+        accum = lagrange_combine_gpu(share_arrays, lagrange_coeffs, prime)
+    elif NUMBA_AVAILABLE and k in (2, 3) and _dot_fits_int64(k, prime):
+        # Unrolled kernels read the flat shares directly (no stacking copy)
+        shape = share_arrays[0].shape
+        flat = [np.asarray(y_arr).reshape(-1) for y_arr in share_arrays]
+        accum = np.empty(flat[0].size, dtype=np.int64)
+        m = _fermat_exponent(prime)
+        if k == 2:
+            lagrange_combine_k2(flat[0], flat[1], int(lagrange_coeffs[0]),
+                                int(lagrange_coeffs[1]), prime, m, accum)
+        else:
+            lagrange_combine_k3(flat[0], flat[1], flat[2], int(lagrange_coeffs[0]),
+                                int(lagrange_coeffs[1]), int(lagrange_coeffs[2]),
+                                prime, m, accum)
+        accum = accum.reshape(shape)
+    elif NUMBA_AVAILABLE and _step_fits_int64(prime):
+        # Stack shares into one contiguous (k, N) buffer for a single kernel call
+        # (its int64 accumulator overflows for primes above about 3e9, which
+        # take the NumPy path below)
+        shape = share_arrays[0].shape
+        stacked = np.stack([np.asarray(y_arr).reshape(-1) for y_arr in share_arrays])
+        accum = np.empty(stacked.shape[1], dtype=np.int64)
+        lagrange_combine(stacked, np.asarray(lagrange_coeffs, dtype=np.int64), prime,
+                         _fermat_exponent(prime), _dot_fits_int64(k, prime), accum)
+        accum = accum.reshape(shape)
+    else:
+        # Largest possible sum of k products y_i * L_i
+        max_share = _max_share_value(share_arrays)
+        bound = k * max_share * (prime - 1)
         
-        if accum is None:
-            accum = term
+        if bound < 2 ** 63:
+            # Multiply-accumulate each share in place into one accumulator of
+            # the narrowest type that holds the full sum (uint32 for the usual
+            # 8-bit field, int64 otherwise), then reduce modulo prime once.
+            # No share stack, no per-share modulo, one reused temporary.
+            acc_dtype = np.uint32 if bound < 2 ** 32 else np.int64
+            accum = np.zeros(share_arrays[0].shape, dtype=acc_dtype)
+            term = np.empty_like(accum)
+            for li, y_arr in zip(lagrange_coeffs, share_arrays):
+                np.multiply(y_arr, int(li), out=term, dtype=acc_dtype, casting='unsafe')
+                np.add(accum, term, out=accum)
+            np.mod(accum, prime, out=accum)
         else:
-            accum = (accum + term) % prime
+            # uint32 shares are widened into one reused uint64 scratch buffer.
+            # A product of two field elements fits in uint64 (prime < 2^32),
+            # so each term is reduced once and the sum of k reduced terms
+            # only at the end
+            accum = np.zeros(share_arrays[0].shape, dtype=np.uint64)
+            term = np.empty_like(accum)
+            for li, y_arr in zip(lagrange_coeffs, share_arrays):
+                if max_share >= prime:
+                    np.mod(y_arr, prime, out=term, dtype=np.uint64)
+                    np.multiply(term, int(li), out=term)
+                else:
+                    np.multiply(y_arr, int(li), out=term, dtype=np.uint64)
+                np.mod(term, prime, out=term)
+                np.add(accum, term, out=accum)
+            np.mod(accum, prime, out=accum)
     
-    # Convert back to appropriate dtype
-    secret = accum.astype(np.int64) % prime
+    # Every path above leaves accum reduced to [0, prime)
+    secret = accum
     
     # Determine output dtype based on max value
     max_val = np.max(secret)
@@ -0,0 +1,79 @@
+/*
+ * Optional C kernel for evaluating the per-pixel share polynomials.
+ *
+ * Build (from the repository root):
+ *   gcc -O3 -march=native -shared -fPIC core/shamir_kernel.c -o core/libshamir_kernel.so
+ *
+ * core/_shamir_kernel.py loads the library with ctypes when it exists;
+ * otherwise the Numba / NumPy implementations are used.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#ifdef __AVX2__
+#include <immintrin.h>
+#endif
+
+/* Barrett reduction of t < 2^64 modulo p, with m = floor((2^64 - 1) / p). */
+static inline uint64_t barrett_u64(uint64_t t, uint64_t p, uint64_t m)
+{
+    uint64_t q = (uint64_t)(((unsigned __int128)t * m) >> 64);
+    uint64_t r = t - q * p;
+    while (r >= p)
+        r -= p;
+    return r;
+}
+
+#ifdef __AVX2__
+/*
+ * 8-lane Horner step for p < 2^16: y * x + c < 2^32, so the products fit in
+ * 32-bit lanes (_mm256_mullo_epi32) and Barrett uses m = floor(2^32 / p).
+ */
+static inline __m256i barrett_u32x8(__m256i t, __m256i vp, __m256i vm)
+{
+    __m256i q_even = _mm256_srli_epi64(_mm256_mul_epu32(t, vm), 32);
+    __m256i q_odd = _mm256_mul_epu32(_mm256_srli_epi64(t, 32), vm);
+    __m256i q = _mm256_blend_epi32(q_even, q_odd, 0xAA);
+    __m256i r = _mm256_sub_epi32(t, _mm256_mullo_epi32(q, vp));
+    /* r is in [0, 2p): subtract p once where needed */
+    return _mm256_min_epu32(r, _mm256_sub_epi32(r, vp));
+}
+#endif
+
+/*
+ * Evaluate out[i] = sum_j coeffs[j * N + i] * x^j mod prime for i in [0, N)
+ * using Horner's method. coeffs is a C-contiguous (k, N) uint32 array.
+ */
+void horner_u32(const uint32_t *coeffs, size_t k, size_t N,
+                uint32_t x, uint32_t prime, uint32_t *out)
+{
+    size_t i = 0;
+
+#ifdef __AVX2__
+    if (prime < (1u << 16) && x < prime) {
+        const __m256i vx = _mm256_set1_epi32((int)x);
+        const __m256i vp = _mm256_set1_epi32((int)prime);
+        const __m256i vm = _mm256_set1_epi32((int)(uint32_t)((1ull << 32) / prime));
+
+        for (; i + 8 <= N; i += 8) {
+            __m256i y = _mm256_loadu_si256((const __m256i *)(coeffs + (k - 1) * N + i));
+            for (size_t j = k - 1; j-- > 0;) {
+                __m256i c = _mm256_loadu_si256((const __m256i *)(coeffs + j * N + i));
+                y = _mm256_add_epi32(_mm256_mullo_epi32(y, vx), c);
+                y = barrett_u32x8(y, vp, vm);
+            }
+            _mm256_storeu_si256((__m256i *)(out + i), y);
+        }
+    }
+#endif
+
+    const uint64_t p = prime;
+    const uint64_t m = UINT64_MAX / p;
+    for (; i < N; i++) {
+        uint64_t y = coeffs[(k - 1) * N + i];
+        for (size_t j = k - 1; j-- > 0;)
+            y = barrett_u64(y * x + coeffs[j * N + i], p, m);
+        out[i] = (uint32_t)y;
+    }
+}
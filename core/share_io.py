@@ -2,9 +2,104 @@
 Share file I/O operations for saving and loading share files.
 """
 
+import struct
+import zipfile
+
 import numpy as np
 
 
+def _pack_share(share_array, max_value):
+    """
+    Store a share in the narrowest layout that holds values up to max_value.
+    
+    Values below 16 are packed two per byte (low nibble first); otherwise
+    the share is stored as uint8, uint16 or uint32. Fields of size 2^b + 1
+    (17, 257, 65537) need one value more than b bits hold, so the rare
+    entries equal to 2^b are stored as 0 and flagged in a packed bitmap.
+    
+    Returns:
+        Tuple of (stored_array, bit_depth, overflow_bitmap or None)
+    """
+    overflow = None
+    if max_value in (1 << 4, 1 << 8, 1 << 16):
+        top = share_array == max_value
+        if top.any():
+            overflow = np.packbits(top.ravel())
+        max_value -= 1
+        share_array = share_array & max_value
+    
+    if max_value < 16:
+        flat = share_array.astype(np.uint8).ravel()
+        if flat.size % 2:
+            flat = np.append(flat, np.uint8(0))
+        return flat[0::2] | (flat[1::2] << 4), 4, overflow
+    
+    for bits, dtype in ((8, np.uint8), (16, np.uint16)):
+        if max_value < (1 << bits):
+            return share_array.astype(dtype), bits, overflow
+    return share_array.astype(np.uint32), 32, overflow
+
+
+def _unpack_share(stored, bit_depth, shape, overflow=None):
+    """Inverse of _pack_share."""
+    if bit_depth == 4:
+        share = np.empty(stored.size * 2, dtype=np.uint8)
+        share[0::2] = stored & 0x0F
+        share[1::2] = stored >> 4
+        share = share[:int(np.prod(shape))].reshape(shape)
+    else:
+        share = stored
+    
+    if overflow is not None:
+        # Restore the flagged entries, widening if 2^b does not fit
+        top_value = 1 << bit_depth
+        share = share.astype(np.min_scalar_type(top_value))
+        top = np.unpackbits(overflow, count=share.size).view(bool)
+        share.reshape(-1)[top] = top_value
+    return share
+
+
+def _mmap_npz_member(filepath, name):
+    """
+    Memory-map an array stored uncompressed inside an .npz archive.
+    
+    np.load ignores mmap_mode for .npz files, so the member's data offset is
+    located by hand: zip local header, then the .npy header. The map is
+    copy-on-write, so callers may modify the array without touching the file.
+    
+    Returns:
+        np.memmap of the array, or None if the member is compressed,
+        missing or not a plain fixed-size dtype
+    """
+    with zipfile.ZipFile(filepath) as zf:
+        try:
+            info = zf.getinfo(name + '.npy')
+        except KeyError:
+            return None
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    
+    with open(filepath, 'rb') as f:
+        # Local file header: 30 fixed bytes, then file name and extra field
+        f.seek(info.header_offset)
+        name_len, extra_len = struct.unpack('<HH', f.read(30)[26:30])
+        f.seek(info.header_offset + 30 + name_len + extra_len)
+        
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        else:
+            return None
+        offset = f.tell()
+    
+    if dtype.hasobject or 0 in shape:
+        return None
+    return np.memmap(filepath, dtype=dtype, mode='c', shape=shape,
+                     order='F' if fortran_order else 'C', offset=offset)
+
+
 def save_share(share_array, x, prime, mode, original_shape, filepath):
     """
     Save a share to a .npz file with metadata.
@@ -17,13 +112,24 @@ def save_share(share_array, x, prime, mode, original_shape, filepath):
         original_shape: Original image shape
         filepath: Path to save the share file
     """
-    np.savez_compressed(
+    # Share values are < prime, so small fields fit in fewer bits than the
+    # uint32 used during computation (edited shares may exceed the field,
+    # hence the check against the actual maximum as well)
+    max_value = max(prime - 1, int(np.max(share_array)))
+    stored, bit_depth, overflow = _pack_share(share_array, max_value)
+    extra = {} if overflow is None else {'overflow': overflow}
+    
+    # Shares are uniformly random field elements, so zlib cannot shrink
+    # them; store uncompressed and skip the wasted compression pass
+    np.savez(
         filepath,
-        share=share_array,
+        share=stored,
+        bit_depth=np.array([bit_depth], dtype=np.int32),
         x=np.array([x], dtype=np.int32),
         prime=np.array([prime], dtype=np.int32),
         mode=np.array([mode], dtype='U10'),
-        original_shape=np.array(original_shape, dtype=np.int32)
+        original_shape=np.array(original_shape, dtype=np.int32),
+        **extra
     )
 
 
@@ -47,12 +153,24 @@ def load_share(filepath):
     # Handle both new format (with metadata) and old format (share only)
     if 'x' in data:
         # New format with metadata
+        original_shape = tuple(int(v) for v in data['original_shape'])
+        bit_depth = int(data['bit_depth'][0]) if 'bit_depth' in data else None
+        if bit_depth == 4 or 'overflow' in data:
+            overflow = data['overflow'] if 'overflow' in data else None
+            share_array = _unpack_share(data['share'], bit_depth, original_shape, overflow)
+        else:
+            # Shares are saved uncompressed, so map them straight from the
+            # page cache instead of copying them into memory
+            share_array = _mmap_npz_member(filepath, 'share')
+            if share_array is None:
+                share_array = data['share']
+        
         return {
-            'share': data['share'],
+            'share': share_array,
             'x': int(data['x'][0]),
             'prime': int(data['prime'][0]),
             'mode': str(data['mode'][0]),
-            'original_shape': tuple(data['original_shape'])
+            'original_shape': original_shape
         }
     else:
         # Old format - only has 'share' array
@@ -11,7 +11,6 @@ Include a view function to visualize the generated images, especially ones at 4-
 
 import numpy as np
 from PIL import Image
-import matplotlib.pyplot as plt
 import argparse
 
 
@@ -148,6 +147,9 @@ def view_image(filename):
     Args:
         filename: Path to the image file
     """
+    # Imported here so generating images does not pay matplotlib's startup cost
+    import matplotlib.pyplot as plt
+    
     img = Image.open(filename)
     img_array = np.array(img)
     
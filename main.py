@@ -7,6 +7,7 @@ By Team: Abhinav, Nikhil, Pranjal
 
 import os
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from core import (
     load_image,
     save_image,
@@ -48,16 +49,28 @@ def cmd_split(args):
     
     # Split image into shares
     print(f"\n[INFO] Splitting image into {args.n} shares (threshold k={args.k})...")
-    shares = split_image_into_shares(img_array, args.n, args.k, prime)
+    if args.device == 'gpu':
+        print(f"[INFO] Evaluating shares on the GPU (CuPy)")
+    shares = split_image_into_shares(img_array, args.n, args.k, prime, device=args.device)
     
-    # Save shares to files
+    # Save shares to files in parallel; each share is one row of the
+    # (n, H, W[, 3]) array, so no per-share copies are made
     os.makedirs(args.output_dir, exist_ok=True)
     print(f"\n[INFO] Saving shares to: {args.output_dir}")
     
-    for x, share_array in shares.items():
-        filepath = os.path.join(args.output_dir, f"share_{x}.npz")
-        save_share(share_array, x, prime, props['mode'], props['shape'], filepath)
-        print(f"  [OK] Saved share_{x}.npz (x={x})")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        pending = []
+        for x in range(1, args.n + 1):
+            share_array = shares[x - 1]
+            filepath = os.path.join(args.output_dir, f"share_{x}.npz")
+            future = executor.submit(
+                save_share, share_array, x, prime, props['mode'], props['shape'], filepath
+            )
+            pending.append((x, future))
+        
+        for x, future in pending:
+            future.result()
+            print(f"  [OK] Saved share_{x}.npz (x={x})")
     
     print(f"\n[SUCCESS] Created {args.n} shares with threshold {args.k}")
     print(f"          Any {args.k} shares can reconstruct the original image.")
@@ -94,7 +107,7 @@ def cmd_reconstruct(args):
     
     # Reconstruct image
     print(f"\n[INFO] Reconstructing image...")
-    reconstructed = reconstruct_from_shares(share_arrays, xs, prime)
+    reconstructed = reconstruct_from_shares(share_arrays, xs, prime, device=args.device)
     
     # Save reconstructed image
     save_image(reconstructed, args.output_image, mode=mode)
@@ -119,6 +132,9 @@ Examples:
 
   # Reconstruct from shares:
   python main.py reconstruct output.png shares/share_1.npz shares/share_3.npz shares/share_5.npz
+
+  # Split on a CUDA GPU (requires CuPy):
+  python main.py split input.png shares --n 5 --k 3 --device gpu
         """
     )
     
@@ -162,6 +178,12 @@ Examples:
         action='store_true',
         help='Force grayscale mode (convert RGB to grayscale)'
     )
+    split_parser.add_argument(
+        '--device',
+        choices=['cpu', 'gpu'],
+        default='cpu',
+        help='Where to run the per-pixel arithmetic (gpu requires CuPy and a CUDA device)'
+    )
     
     # Reconstruct command
     reconstruct_parser = subparsers.add_parser(
@@ -179,6 +201,12 @@ Examples:
         nargs='+',
         help='Paths to share files for reconstruction (at least k shares)'
     )
+    reconstruct_parser.add_argument(
+        '--device',
+        choices=['cpu', 'gpu'],
+        default='cpu',
+        help='Where to run the per-pixel arithmetic (gpu requires CuPy and a CUDA device)'
+    )
     
     return parser.parse_args()
 
@@ -2,11 +2,25 @@
 Compare two images for verification after reconstruction.
 """
 
-from PIL import Image
 import numpy as np
 import sys
 
 
+def _image_to_array(img):
+    """
+    Wrap an 'L' or 'RGB' PIL image's raw bytes as a read-only uint8 array.
+    
+    Args:
+        img: PIL image in mode 'L' or 'RGB'
+        
+    Returns:
+        Numpy array (H x W for 'L', H x W x 3 for 'RGB')
+    """
+    width, height = img.size
+    shape = (height, width) if img.mode == 'L' else (height, width, 3)
+    return np.frombuffer(img.tobytes(), dtype=np.uint8).reshape(shape)
+
+
 def compare_images(img1_path, img2_path):
     """
     Compare two images pixel by pixel.
@@ -15,6 +29,9 @@ def compare_images(img1_path, img2_path):
         img1_path: Path to first image
         img2_path: Path to second image
     """
+    # Imported on first use so importing this module does not load PIL
+    from PIL import Image
+    
     # Load images
     img1 = Image.open(img1_path)
     img2 = Image.open(img2_path)
@@ -48,9 +65,9 @@ def compare_images(img1_path, img2_path):
         img1 = img1.convert("RGB")
         img2 = img2.convert("RGB")
 
-    # Convert to numpy arrays
-    arr1 = np.array(img1)
-    arr2 = np.array(img2)
+    # Convert to numpy arrays (straight from PIL's raw buffers)
+    arr1 = _image_to_array(img1)
+    arr2 = _image_to_array(img2)
 
     # Check shape compatibility
     if arr1.shape != arr2.shape:
@@ -59,9 +76,13 @@ def compare_images(img1_path, img2_path):
         print(f"        Image 2: {arr2.shape}")
         return False
 
-    # Compare pixels
-    diff = arr1 != arr2
-    num_diff_pixels = np.count_nonzero(np.any(diff, axis=-1) if arr1.ndim == 3 else diff)
+    # Compare pixels: XOR is nonzero wherever a byte differs; for RGB the
+    # channel planes are OR-ed together so each pixel is counted once
+    # (much faster than np.any over the short channel axis)
+    diff = np.bitwise_xor(arr1, arr2)
+    if diff.ndim == 3:
+        diff = diff[..., 0] | diff[..., 1] | diff[..., 2]
+    num_diff_pixels = np.count_nonzero(diff)
     total_pixels = arr1.shape[0] * arr1.shape[1]
 
     print(f"\n{'='*60}")
@@ -79,7 +100,8 @@ def compare_images(img1_path, img2_path):
         print(f"        Matching pixels: {total_pixels - num_diff_pixels}")
 
         # Analyze difference magnitude
-        abs_diff = np.abs(arr1.astype(int) - arr2.astype(int))
+        # (int16 holds any difference of two uint8 values)
+        abs_diff = np.abs(arr1.astype(np.int16) - arr2.astype(np.int16))
         max_diff = abs_diff.max()
         mean_diff = abs_diff.mean()
         
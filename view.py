@@ -4,7 +4,6 @@ Display share metadata and pixel intensity values.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 import sys
 import os
 
@@ -21,18 +20,21 @@ def display_share_info(filepath):
     has_metadata = 'x' in data
     
     if has_metadata:
-        # New format with metadata
-        share_array = data['share']
-        x = int(data['x'][0])
-        prime = int(data['prime'][0])
-        mode = str(data['mode'][0])
-        original_shape = tuple(data['original_shape'])
+        # New format with metadata (load_share unpacks bit-packed shares).
+        # Imported here because the core package pulls in Numba and the C
+        # kernel at import time, which the old-format and Exit paths never need
+        from core import load_share
+        share_data = load_share(filepath)
+        share_array = share_data['share']
+        mode = share_data['mode']
         
         print(f"\nMetadata:")
-        print(f"  X-coordinate: {x}")
-        print(f"  Prime (field): {prime}")
+        print(f"  X-coordinate: {share_data['x']}")
+        print(f"  Prime (field): {share_data['prime']}")
         print(f"  Image mode: {mode}")
-        print(f"  Original shape: {original_shape}")
+        print(f"  Original shape: {share_data['original_shape']}")
+        if 'bit_depth' in data:
+            print(f"  Stored bits per value: {int(data['bit_depth'][0])}")
     else:
         # Old format - only share array
         share_array = data['share']
@@ -55,6 +57,9 @@ def display_share_info(filepath):
 
 def visualize_share(share_array, mode, show_values=False):
     """Visualize the share array."""
+    # Imported here so the metadata-only paths skip matplotlib's startup cost
+    import matplotlib.pyplot as plt
+    
     if mode == 'grayscale':
         # Display grayscale share
         fig, ax = plt.subplots(figsize=(10, 8))
@@ -69,33 +74,37 @@ def visualize_share(share_array, mode, show_values=False):
                     text = ax.text(j, i, int(share_array[i, j]),
                                  ha="center", va="center", color="red", fontsize=8)
     else:
-        # Display RGB share (show each channel separately)
-        fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+        # Display RGB share: combined view and each channel side by side in a
+        # single (H, 4W, 3) mosaic, rendered with one imshow
+        H, W = share_array.shape[:2]
+        fig, ax = plt.subplots(figsize=(16, 5))
+        
+        # Normalize to 0-255 for display
+        max_val = max(int(np.max(share_array)), 1)
+        normalized = (share_array.astype(np.float32) * (255.0 / max_val)).astype(np.uint8)
         
-        # Combined RGB view (normalized for display)
-        max_val = np.max(share_array)
-        normalized = (share_array.astype(np.float32) / max_val * 255).astype(np.uint8)
-        axes[0, 0].imshow(normalized)
-        axes[0, 0].set_title('Combined RGB (normalized)')
-        axes[0, 0].axis('off')
+        # Panel 0 is the combined RGB view; panel c+1 keeps only channel c
+        mosaic = np.zeros((H, 4 * W, 3), dtype=np.uint8)
+        mosaic[:, :W] = normalized
+        for idx in range(3):
+            mosaic[:, (idx + 1) * W:(idx + 2) * W, idx] = normalized[:, :, idx]
         
-        # Individual channels
-        channel_names = ['Red', 'Green', 'Blue']
-        colors = ['Reds', 'Greens', 'Blues']
-        for idx, (name, cmap) in enumerate(zip(channel_names, colors)):
-            row = (idx + 1) // 2
-            col = (idx + 1) % 2
-            im = axes[row, col].imshow(share_array[:, :, idx], cmap=cmap, interpolation='nearest')
-            axes[row, col].set_title(f'{name} Channel')
-            plt.colorbar(im, ax=axes[row, col], label='Intensity')
-            
-            # Show pixel values if small enough
-            if show_values and share_array.shape[0] <= 10 and share_array.shape[1] <= 10:
-                for i in range(share_array.shape[0]):
-                    for j in range(share_array.shape[1]):
-                        text = axes[row, col].text(j, i, int(share_array[i, j, idx]),
-                                                  ha="center", va="center", 
-                                                  color="yellow", fontsize=6)
+        ax.imshow(mosaic, interpolation='nearest')
+        for idx in range(1, 4):
+            ax.axvline(idx * W - 0.5, color='white', linewidth=1)
+        ax.set_xticks([(idx + 0.5) * W for idx in range(4)])
+        ax.set_xticklabels(['Combined RGB (normalized)', 'Red Channel',
+                            'Green Channel', 'Blue Channel'])
+        ax.set_yticks([])
+        ax.set_title('Share Visualization (RGB)')
+        
+        # Show pixel values if small enough
+        if show_values and H <= 10 and W <= 10:
+            for idx in range(3):
+                for i in range(H):
+                    for j in range(W):
+                        ax.text((idx + 1) * W + j, i, int(share_array[i, j, idx]),
+                                ha="center", va="center", color="yellow", fontsize=6)
         
         plt.tight_layout()
     
@@ -104,6 +113,8 @@ def visualize_share(share_array, mode, show_values=False):
 
 def draw_on_share(share_array, filepath):
     """Interactive drawing on share (from original view.py functionality)."""
+    import matplotlib.pyplot as plt
+    
     brush_value = 255
     brush_size = 3
     
@@ -130,18 +141,15 @@ def draw_on_share(share_array, filepath):
         r = int(round(event.ydata))
         c = int(round(event.xdata))
         
-        # Draw a brush circle
-        for dr in range(-brush_size, brush_size + 1):
-            for dc in range(-brush_size, brush_size + 1):
-                rr = r + dr
-                cc = c + dc
-                if 0 <= rr < share_array.shape[0] and 0 <= cc < share_array.shape[1]:
-                    if is_rgb:
-                        share_array[rr, cc, :] = brush_value
-                        display_array[rr, cc] = brush_value
-                    else:
-                        share_array[rr, cc] = brush_value
-                        display_array[rr, cc] = brush_value
+        # Paint the square brush around (r, c), clipped to the share
+        # (the upper bounds must not go negative, or NumPy would read them
+        # as from-the-end indices)
+        r0, r1 = max(0, r - brush_size), min(share_array.shape[0], r + brush_size + 1)
+        c0, c1 = max(0, c - brush_size), min(share_array.shape[1], c + brush_size + 1)
+        if r1 <= r0 or c1 <= c0:
+            return
+        share_array[r0:r1, c0:c1] = brush_value  # all channels for RGB
+        display_array[r0:r1, c0:c1] = brush_value
         
         img.set_data(display_array)
         fig.canvas.draw_idle()
@@ -168,9 +176,16 @@ def draw_on_share(share_array, filepath):
     if output:
         # Load original data and update share
         data = np.load(filepath, allow_pickle=False)
-        save_dict = dict(data)
-        save_dict['share'] = share_array
-        np.savez_compressed(output, **save_dict)
+        if 'x' in data:
+            # Re-save through save_share so the storage packing matches the data
+            from core import load_share, save_share
+            meta = load_share(filepath)
+            save_share(share_array, meta['x'], meta['prime'], meta['mode'],
+                       meta['original_shape'], output)
+        else:
+            save_dict = dict(data)
+            save_dict['share'] = share_array
+            np.savez(output, **save_dict)
         print(f"[SUCCESS] Saved modified share to: {output}")
 
 